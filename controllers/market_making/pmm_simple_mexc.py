@@ -1,63 +1,26 @@
+import asyncio
 import logging
 from decimal import Decimal
 from typing import List, Optional
-import requests
+
 from pydantic import Field
-import time
 
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_client import CoinGeckoClient
 from hummingbot.strategy_v2.controllers.market_making_controller_base import (
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
 )
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 
-# --- CoinGecko price fetch utilities ---
-def get_coingecko_id(symbol: str) -> Optional[str]:
-    url = "https://api.coingecko.com/api/v3/coins/list"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        for coin in data:
-            if coin["symbol"].lower() == symbol.lower():
-                return coin["id"]
-    except Exception as e:
-        logging.getLogger().error(f"Error fetching CoinGecko ID for {symbol}: {e}")
-    return None
-
-def get_price_from_specific_market_coingecko(base_token_id: str, quote_market_identifier: str) -> Optional[Decimal]:
-    url_tickers = f"https://api.coingecko.com/api/v3/coins/{base_token_id}/tickers"
-    try:
-        response_tickers = requests.get(url_tickers)
-        response_tickers.raise_for_status()
-        data_tickers = response_tickers.json()
-    except requests.exceptions.RequestException as e:
-        logging.getLogger().error(f"Error fetching ticker data from CoinGecko: {e}")
-        return None
-
-    if "tickers" in data_tickers and data_tickers["tickers"]:
-        for ticker in data_tickers["tickers"]:
-            market_identifier = ticker.get("market", {}).get("identifier")
-            if market_identifier == quote_market_identifier:
-                price_usd = ticker.get("converted_last", {}).get("usd")
-                if price_usd is not None:
-                    return Decimal(str(price_usd))
-                else:
-                    logging.getLogger().warning(f"Price data not available for {base_token_id} on market {quote_market_identifier}.")
-                    return None
-        logging.getLogger().warning(f"Market with identifier '{quote_market_identifier}' not found for {base_token_id} on CoinGecko.")
-        return None
-    else:
-        logging.getLogger().warning(f"No ticker data found for {base_token_id} on CoinGecko.")
-        return None
 
 class PMMSimpleConfig(MarketMakingControllerConfigBase):
     controller_name: str = "pmm_simple_cg"
     # As this controller is a simple version of the PMM, we are not using the candles feed
     candles_config: List[CandlesConfig] = Field(default=[])
     base_token: str = Field("MNTL", description="The token symbol to get price for from CoinGecko")
-    quote_market: str = Field("osmosis", description="The CoinGecko market identifier for price source")
+    quote_market: str = Field("osmosis", description="The CoinGecko market identifier for price source, or 'aggregated' for the aggregated USD price")
 
 
 class PMMSimpleController(MarketMakingControllerBase):
@@ -65,31 +28,53 @@ class PMMSimpleController(MarketMakingControllerBase):
         super().__init__(config, *args, **kwargs)
         self.config = config
         self._base_token_coingecko_id: Optional[str] = None
-        self._last_cg_price: Optional[Decimal] = None
-        self._last_cg_price_time: float = 0
         self._cg_price_refresh_interval: float = 30  # seconds
+        self._cg_price_refresh_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        super().start()
+        if self._cg_price_refresh_task is None or self._cg_price_refresh_task.done():
+            self._cg_price_refresh_task = safe_ensure_future(self._refresh_cg_price_loop())
+
+    def on_stop(self):
+        if self._cg_price_refresh_task is not None:
+            self._cg_price_refresh_task.cancel()
+            self._cg_price_refresh_task = None
+
+    async def _refresh_cg_price_loop(self):
+        """
+        Keeps the shared price cache warm in the background so get_executor_config never waits on CoinGecko.
+        """
+        while True:
+            try:
+                if self._base_token_coingecko_id is None:
+                    # The coins list lookup is blocking (disk or HTTP), keep it off the event loop
+                    self._base_token_coingecko_id = await CoinGeckoClient.get_instance().get_coin_id_async(
+                        self.config.base_token)
+                if self._base_token_coingecko_id is not None:
+                    cg_price = await CoinGeckoClient.get_instance().get_price(self._base_token_coingecko_id,
+                                                                              self.config.quote_market,
+                                                                              self._cg_price_refresh_interval)
+                    if cg_price is not None:
+                        logging.getLogger().info(f"Fetched new CoinGecko price: {cg_price}")
+                    else:
+                        logging.getLogger().error(f"CoinGecko price unavailable for {self.config.base_token} on {self.config.quote_market}.")
+                else:
+                    logging.getLogger().error(f"CoinGecko ID unavailable for {self.config.base_token}.")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logging.getLogger().error("Unexpected error refreshing CoinGecko price.", exc_info=True)
+            await asyncio.sleep(self._cg_price_refresh_interval)
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
         trade_type = self.get_trade_type_from_level_id(level_id)
-        now = time.time()
         # Always use CoinGecko price for entry_price
-        if self._base_token_coingecko_id is None:
-            self._base_token_coingecko_id = get_coingecko_id(self.config.base_token)
-        if self._base_token_coingecko_id is not None:
-            # Only fetch new price if interval has passed
-            if self._last_cg_price is None or now - self._last_cg_price_time > self._cg_price_refresh_interval:
-                cg_price = get_price_from_specific_market_coingecko(self._base_token_coingecko_id, self.config.quote_market)
-                if cg_price is not None:
-                    self._last_cg_price = cg_price
-                    self._last_cg_price_time = now
-                    logging.getLogger().info(f"Fetched new CoinGecko price: {cg_price}")
-                else:
-                    logging.getLogger().error(f"CoinGecko price unavailable for {self.config.base_token} on {self.config.quote_market}. Order will not be created.")
-                    return None
-            entry_price = self._last_cg_price
-        else:
-            logging.getLogger().error(f"CoinGecko ID unavailable for {self.config.base_token}. Order will not be created.")
-            return None
+        entry_price = CoinGeckoClient.get_instance().get_cached_price(self._base_token_coingecko_id,
+                                                                      self.config.quote_market)
+        if entry_price is None:
+            logging.getLogger().error(f"CoinGecko price unavailable for {self.config.base_token} on {self.config.quote_market}. Order will not be created.")
+            return None  # Do not create order
         return PositionExecutorConfig(
             timestamp=self.market_data_provider.time(),
             level_id=level_id,
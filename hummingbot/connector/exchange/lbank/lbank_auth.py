@@ -1,21 +1,26 @@
 import hashlib
 import hmac
-import json
 import random
 import string
 import time
-from base64 import b64encode
+from base64 import b64decode, b64encode
 from dataclasses import replace
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from Crypto.Hash import SHA256
-from Crypto.PublicKey import RSA
-from Crypto.Signature import PKCS1_v1_5
+import ujson
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
 
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
+# Parsed RSA keys, keyed by a digest of their PEM text so the secret itself is not kept as a dict key
+_RSA_KEY_CACHE: Dict[str, "RSAPrivateKey"] = {}
+
+# LBank only accepts alphanumeric echostr nonces
+_ECHOSTR_ALPHABET = string.ascii_letters + string.digits
+
 
 class LbankAuth(AuthBase):
 
@@ -28,12 +33,32 @@ class LbankAuth(AuthBase):
         self.api_key: str = api_key
         self.secret_key: str = self.RSA_KEY_FORMAT.format(secret_key) if auth_method == "RSA" else secret_key
         self.auth_method: str = auth_method
+        # Loaded on the first signed request, so later requests skip the key cache lookup
+        self._rsa_key: Optional["RSAPrivateKey"] = None
+
+    @staticmethod
+    def import_rsa_key(pem: str) -> "RSAPrivateKey":
+        """
+        Returns the RSA key parsed from the PEM text. The ASN.1/DER parsing is done once per key, later calls (every
+        signed request and config validation) are a dict lookup.
+        """
+        key_hash = hashlib.blake2b(pem.encode("utf-8")).hexdigest()
+        key = _RSA_KEY_CACHE.get(key_hash)
+        if key is None:
+            # Only loaded by users of the RSA auth method
+            from cryptography.hazmat.primitives.serialization import load_der_private_key
+
+            # LBank keys are often PKCS#8 despite the RSA PRIVATE KEY label, loading the DER body accepts both
+            der = b64decode("".join(line.strip() for line in pem.splitlines() if not line.startswith("-----")))
+            key = load_der_private_key(der, password=None)
+            _RSA_KEY_CACHE[key_hash] = key
+        return key
 
     def _time(self) -> int:
         return int(round(time.time() * 1e3))
 
     def _generate_rand_str(self) -> str:
-        return "".join(random.sample(string.ascii_letters + string.digits, 35))
+        return "".join(random.choices(_ECHOSTR_ALPHABET, k=35))
 
     def _generate_auth_signature(self, data: Dict[str, Any]) -> Optional[str]:
         """
@@ -41,13 +66,19 @@ class LbankAuth(AuthBase):
         request.
         """
 
-        payload: str = hashlib.md5(urlencode(dict(sorted(data.items()))).encode("utf-8")).hexdigest().upper()
+        # LBank signs the upper-case hex MD5 of the sorted parameters, so the hex form is part of the protocol. The
+        # parameters (api key, nonce, timestamp, symbols, decimal strings, order ids) never contain characters that
+        # urlencode would quote, so they are joined directly
+        query: str = "&".join(f"{key}={data[key]}" for key in sorted(data))
+        payload: str = hashlib.md5(query.encode("utf-8"), usedforsecurity=False).hexdigest().upper()
         if self.auth_method == "RSA":
-            key = RSA.importKey(self.secret_key)
-            signer = PKCS1_v1_5.new(key)
-            digest = SHA256.new()
-            digest.update(payload.encode("utf-8"))
-            return b64encode(signer.sign(digest)).decode("utf-8")
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.asymmetric import padding
+
+            if self._rsa_key is None:
+                self._rsa_key = self.import_rsa_key(self.secret_key)
+            signature = self._rsa_key.sign(payload.encode("utf-8"), padding.PKCS1v15(), hashes.SHA256())
+            return b64encode(signature).decode("utf-8")
         elif self.auth_method == "HmacSHA256":
             secret_bytes = bytes(self.secret_key, encoding="utf-8")
             payload_bytes = bytes(payload, encoding="utf-8")
@@ -83,7 +114,7 @@ class LbankAuth(AuthBase):
 
         data = {}
         if request.data is not None:
-            data.update(json.loads(request.data))
+            data.update(ujson.loads(request.data))
         data.update(additional_params)
 
         signature: Optional[str] = self._generate_auth_signature(data)
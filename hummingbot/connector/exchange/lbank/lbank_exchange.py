@@ -1,8 +1,8 @@
 import asyncio
-import json
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
+import ujson
 from bidict import bidict
 
 from hummingbot.connector.exchange.lbank import lbank_constants as CONSTANTS, lbank_web_utils as web_utils
@@ -257,7 +257,7 @@ class LbankExchange(ExchangePyBase):
                                                                     is_auth_required=True)
 
         if isinstance(response, str):  # Error responses are in text/html
-            response: Dict[str, Any] = json.loads(response)
+            response: Dict[str, Any] = ujson.loads(response)
         err_code: Optional[int] = response.get("error_code", 0)
         if err_code > 0:
             err_msg: str = CONSTANTS.ERROR_CODES.get(err_code, "")
@@ -289,7 +289,7 @@ class LbankExchange(ExchangePyBase):
             limit_id=CONSTANTS.LBANK_ORDER_UPDATES_PATH_URL,
         )
         if isinstance(response, str):  # Error responses are in text/html
-            response: Dict[str, Any] = json.loads(response)
+            response: Dict[str, Any] = ujson.loads(response)
             err_code: Optional[int] = response.get("error_code", 0)
             if err_code > 0:
                 err_msg: str = CONSTANTS.ERROR_CODES.get(err_code, "")
@@ -310,7 +310,7 @@ class LbankExchange(ExchangePyBase):
             limit_id=CONSTANTS.LBANK_TRADE_UPDATES_PATH_URL,
         )
         if isinstance(response, str):  # Error responses are in text/html
-            response: Dict[str, Any] = json.loads(response)
+            response: Dict[str, Any] = ujson.loads(response)
             err_code: Optional[int] = response.get("error_code", 0)
             if err_code > 0:
                 err_msg: str = CONSTANTS.ERROR_CODES.get(err_code, "")
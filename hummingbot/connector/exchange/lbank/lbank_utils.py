@@ -1,7 +1,6 @@
 from decimal import Decimal
 from typing import Dict, Literal
 
-from Crypto.PublicKey import RSA
 from pydantic import ConfigDict, Field, model_validator
 from pydantic.types import SecretStr
 
@@ -62,7 +61,7 @@ class LbankConfigMap(BaseConnectorConfigMap):
             
         if self.lbank_auth_method == "RSA" and hasattr(self, 'lbank_secret_key'):
             try:
-                RSA.importKey(LbankAuth.RSA_KEY_FORMAT.format(self.lbank_secret_key.get_secret_value()))
+                LbankAuth.import_rsa_key(LbankAuth.RSA_KEY_FORMAT.format(self.lbank_secret_key.get_secret_value()))
             except Exception as e:
                 raise ValueError(f"Unable to import RSA keys. Error: {str(e)}")
         return self
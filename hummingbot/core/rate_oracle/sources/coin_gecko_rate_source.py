@@ -66,6 +66,11 @@ class CoinGeckoRateSource(RateSourceBase):
             # Update rate limits directly from the tier
             self._coin_gecko_data_feed._api_factory._throttler._rate_limits = new_tier.value.rate_limits
 
+    @property
+    def data_feed(self) -> CoinGeckoDataFeed:
+        self._ensure_data_feed()
+        return self._coin_gecko_data_feed
+
     def try_event(self, fn):
         @functools.wraps(fn)
         async def try_raise_event(*args, **kwargs):
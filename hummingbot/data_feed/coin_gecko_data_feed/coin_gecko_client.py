@@ -0,0 +1,339 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterator, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_constants import (
+    AGGREGATED_MARKET,
+    COIN_TICKERS_REST_ENDPOINT,
+    COINS_LIST_REST_ENDPOINT,
+    REST_CALL_RATE_LIMIT_ID,
+    SIMPLE_PRICE_REST_ENDPOINT,
+)
+from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_data_feed import CoinGeckoDataFeed
+from hummingbot.logger import HummingbotLogger
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Decode prices straight to Decimal, instead of through a float and its repr
+    _json_loads = functools.partial(json.loads, parse_float=Decimal)
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+COINS_LIST_CACHE_PATH = Path("~/.hummingbot_cache/coingecko_list.json").expanduser()
+COINS_LIST_CACHE_TTL = 86400  # seconds
+
+
+class CoinGeckoClient:
+    """
+    Process-wide CoinGecko REST client for the strategies and controllers that price off a specific CoinGecko market.
+    Sharing one instance lets them reuse the on-disk coins list cache and the in-memory price cache, instead of each
+    hitting the API independently. Price requests go through the REST assistant of a CoinGeckoDataFeed, so they are
+    authenticated and throttled with the feed's API tier and share its request budget.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["CoinGeckoClient"] = None
+
+    @classmethod
+    def get_instance(cls) -> "CoinGeckoClient":
+        if cls._shared_instance is None:
+            cls._shared_instance = CoinGeckoClient(data_feed=cls._configured_data_feed())
+        return cls._shared_instance
+
+    @staticmethod
+    def _configured_data_feed() -> CoinGeckoDataFeed:
+        """
+        The data feed of the rate oracle source when it is CoinGecko, so the shared client uses the configured API tier
+        and key and doesn't keep a second rate limiter for the same budget. Otherwise the shared public tier feed.
+        """
+        from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+        from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
+
+        source = RateOracle.get_instance().source
+        if isinstance(source, CoinGeckoRateSource):
+            return source.data_feed
+        return CoinGeckoDataFeed.get_instance()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(
+        self,
+        data_feed: Optional[CoinGeckoDataFeed] = None,
+        coins_list_cache_path: Path = COINS_LIST_CACHE_PATH,
+        coins_list_cache_ttl: float = COINS_LIST_CACHE_TTL,
+    ):
+        self._data_feed = data_feed or CoinGeckoDataFeed()
+        self._coins_list_cache_path = coins_list_cache_path
+        self._coins_list_cache_ttl = coins_list_cache_ttl
+
+        # Blocking session for the coins list, which is resolved once a day from sync callers and executor threads
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=2,
+                                                    pool_maxsize=8,
+                                                    max_retries=Retry(total=2,
+                                                                      backoff_factor=0.3,
+                                                                      status_forcelist=[502, 503, 504])))
+        self._session.headers.update({"Connection": "keep-alive"})
+
+        self._symbol_to_id: Dict[str, str] = {}
+        self._symbol_to_id_lock = threading.Lock()
+        self._price_cache: Dict[Tuple[str, str], Tuple[Decimal, float]] = {}
+        # Price fetches in flight, so concurrent callers for the same (coin, market) share a single request
+        self._inflight_prices: Dict[Tuple[str, str], asyncio.Task] = {}
+        # Last raw price decoded per (coin, market) and its Decimal, reused while CoinGecko keeps quoting the same value
+        self._last_raw_prices: Dict[Tuple[str, str], Tuple[Any, Decimal]] = {}
+
+        # Sliding window of recent price request timestamps, so the request rate stays within the tier limit
+        self._rate_limit = next(rate_limit for rate_limit in self._data_feed.api_tier.value.rate_limits
+                                if rate_limit.limit_id == REST_CALL_RATE_LIMIT_ID)
+        self._request_times: Deque[float] = deque()
+        self._request_times_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return self._data_feed.api_tier.value.base_url
+
+    def get_coin_id(self, symbol: str) -> Optional[str]:
+        """
+        Returns the CoinGecko id of the first coin listed with the given symbol. Blocks on the first call while the
+        coins list is read from disk or downloaded, later lookups are a dict get.
+        """
+        try:
+            return self._get_symbol_index().get(symbol.lower())
+        except Exception as e:
+            self.logger().error(f"Error fetching CoinGecko ID for {symbol}: {e}")
+        return None
+
+    async def get_coin_id_async(self, symbol: str) -> Optional[str]:
+        """
+        Same as get_coin_id, but resolves the id in the default executor so the event loop is not blocked.
+        """
+        return await asyncio.get_event_loop().run_in_executor(None, self.get_coin_id, symbol)
+
+    def get_cached_price(self, coin_id: str, market: str) -> Optional[Decimal]:
+        """
+        Returns the last price fetched for the coin on the market, without any network access.
+        """
+        cached = self._price_cache.get((coin_id, market))
+        return cached[0] if cached is not None else None
+
+    async def get_price(self, coin_id: str, market: str, max_age: float) -> Optional[Decimal]:
+        """
+        Returns the USD price of the coin on the market, from the cache when it is younger than max_age seconds.
+        Callers that arrive while a fetch for the same coin and market is in flight await that fetch instead of
+        sending their own request. If the price can't be fetched (e.g. the request rate limit is reached) the last
+        known price is returned.
+
+        :param coin_id: the CoinGecko coin id (see get_coin_id)
+        :param market: the CoinGecko market identifier, or AGGREGATED_MARKET for the aggregated USD price
+        :param max_age: the maximum age in seconds of a cached price to be returned
+        """
+        key = (coin_id, market)
+        cached = self._price_cache.get(key)
+        if cached is not None and time.time() - cached[1] <= max_age:
+            return cached[0]
+        task = self._inflight_prices.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh_price(coin_id, market))
+            self._inflight_prices[key] = task
+            task.add_done_callback(lambda _: self._inflight_prices.pop(key, None))
+        # Shielded so a cancelled caller doesn't cancel the fetch the other callers are awaiting
+        return await asyncio.shield(task)
+
+    async def fetch_price(self, coin_id: str, market: str) -> Optional[Decimal]:
+        """
+        Fetches the USD price of the coin on the market, bypassing the cache. Returns None without sending the request
+        when the request rate limit is reached.
+        """
+        if not self._try_acquire_request_slot():
+            return None
+        url, params = self._price_request(coin_id, market)
+        try:
+            data = await self._get_json(url, params=params)
+        except (aiohttp.ClientError, IOError, asyncio.TimeoutError, ValueError) as e:
+            self.logger().error(f"Error fetching price data from CoinGecko: {e}")
+            return None
+        return self._parse_price(data, coin_id, market)
+
+    async def _refresh_price(self, coin_id: str, market: str) -> Optional[Decimal]:
+        key = (coin_id, market)
+        price = await self.fetch_price(coin_id, market)
+        if price is not None:
+            self._price_cache[key] = (price, time.time())
+            return price
+        cached = self._price_cache.get(key)
+        return cached[0] if cached is not None else None
+
+    def _try_acquire_request_slot(self) -> bool:
+        """
+        Records a request if fewer than the tier limit were sent in the last rate limit interval. Never waits: a caller
+        over the limit is better served by the last known price than by queueing into a 429 back-off.
+        """
+        now = time.time()
+        with self._request_times_lock:
+            while self._request_times and now - self._request_times[0] >= self._rate_limit.time_interval:
+                self._request_times.popleft()
+            if len(self._request_times) >= self._rate_limit.limit:
+                self.logger().warning("CoinGecko request rate limit reached, using the last known price.")
+                return False
+            self._request_times.append(now)
+            return True
+
+    def _price_request(self, coin_id: str, market: str) -> Tuple[str, Dict[str, str]]:
+        if market == AGGREGATED_MARKET:
+            # /simple/price returns a few bytes, instead of every ticker listed for the coin
+            return f"{self.base_url}{SIMPLE_PRICE_REST_ENDPOINT}", {"ids": coin_id, "vs_currencies": "usd"}
+        # Only the tickers of the requested market, without order book depth, instead of every market listing the coin
+        return (f"{self.base_url}{COIN_TICKERS_REST_ENDPOINT.format(coin_id)}",
+                {"exchange_ids": market, "depth": "false"})
+
+    def _to_decimal(self, coin_id: str, market: str, raw_price: Any) -> Decimal:
+        if isinstance(raw_price, Decimal):
+            return raw_price
+        key = (coin_id, market)
+        last = self._last_raw_prices.get(key)
+        if last is not None and last[0] == raw_price:
+            return last[1]
+        price = Decimal(str(raw_price))
+        self._last_raw_prices[key] = (raw_price, price)
+        return price
+
+    def _parse_price(self, data: Dict[str, Any], coin_id: str, market: str) -> Optional[Decimal]:
+        if market == AGGREGATED_MARKET:
+            price_usd = data.get(coin_id, {}).get("usd")
+            if price_usd is None:
+                self.logger().warning(f"No USD price found for {coin_id} on CoinGecko.")
+                return None
+            return self._to_decimal(coin_id, market, price_usd)
+
+        tickers = data.get("tickers")
+        if tickers:
+            for ticker in tickers:
+                # Plain lookups rather than .get(key, {}), which allocates an empty dict for every ticker
+                try:
+                    market_identifier = ticker["market"]["identifier"]
+                except KeyError:
+                    continue
+                if market_identifier == market:
+                    converted_last = ticker.get("converted_last")
+                    price_usd = converted_last.get("usd") if converted_last is not None else None
+                    if price_usd is not None:
+                        return self._to_decimal(coin_id, market, price_usd)
+                    else:
+                        self.logger().warning(f"Price data not available for {coin_id} on market {market}.")
+                        return None
+            self.logger().warning(f"Market with identifier '{market}' not found for {coin_id} on CoinGecko.")
+            return None
+        else:
+            self.logger().warning(f"No ticker data found for {coin_id} on CoinGecko.")
+            return None
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, str]] = None) -> Any:
+        rest_assistant = await self._data_feed.get_rest_assistant()
+        response = await rest_assistant.execute_request_and_get_response(
+            url=url,
+            throttler_limit_id=REST_CALL_RATE_LIMIT_ID,
+            params=params,
+            headers=self._data_feed.auth_headers,
+            timeout=10,
+        )
+        return _json_loads(await response.text())
+
+    def _get_symbol_index(self) -> Dict[str, str]:
+        """
+        Returns the lowercased symbol -> id index, built once from the coins list under a lock so concurrent lookups
+        (e.g. from executor threads) don't fetch the list twice or observe a half-built index.
+        """
+        if not self._symbol_to_id:
+            with self._symbol_to_id_lock:
+                if not self._symbol_to_id:
+                    index: Dict[str, str] = {}
+                    # Keep the first coin listed for a symbol
+                    for coin in self._iter_coin_list():
+                        index.setdefault(coin["symbol"].lower(), coin["id"])
+                    self._symbol_to_id.update(index)
+        return self._symbol_to_id
+
+    def _iter_coin_list(self) -> Iterator[Dict[str, str]]:
+        """
+        Yields the CoinGecko coins list, read from the on-disk cache while it is younger than the cache TTL. Otherwise
+        the list is revalidated with the ETag stored next to the cache, and only downloaded when it has changed: then
+        straight into the cache file (swapped in atomically) and read back from it.
+        """
+        cache_path = self._coins_list_cache_path
+        etag_path = cache_path.with_suffix(".etag")
+        try:
+            cache_mtime: Optional[float] = cache_path.stat().st_mtime
+        except OSError:
+            cache_mtime = None
+        if cache_mtime is None or cache_mtime <= time.time() - self._coins_list_cache_ttl:
+            headers = {}
+            if cache_mtime is not None:
+                try:
+                    headers["If-None-Match"] = etag_path.read_text().strip()
+                except OSError:
+                    pass
+            url = f"{self.base_url}{COINS_LIST_REST_ENDPOINT}"
+            headers.update(self._data_feed.auth_headers)
+            with self._session.get(url, headers=headers, timeout=(3, 10), stream=True) as response:
+                response.raise_for_status()
+                if response.status_code == 304:
+                    # The list hasn't changed, restart the TTL of the cached copy
+                    os.utime(cache_path)
+                else:
+                    try:
+                        cache_path.parent.mkdir(parents=True, exist_ok=True)
+                        tmp_file = cache_path.with_suffix(".tmp").open("wb")
+                    except OSError as e:
+                        self.logger().warning(f"Unable to cache CoinGecko coins list at {cache_path}: {e}")
+                        response.raw.decode_content = True
+                        yield from self._iter_json_items(response.raw)
+                        return
+                    with tmp_file:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            tmp_file.write(chunk)
+                    os.replace(tmp_file.name, cache_path)
+                    etag = response.headers.get("ETag")
+                    if etag is not None:
+                        etag_path.write_text(etag)
+                    else:
+                        etag_path.unlink(missing_ok=True)
+        try:
+            with cache_path.open("rb") as f:
+                yield from self._iter_json_items(f)
+        except Exception:
+            # Drop a corrupt cache so the next lookup downloads the list again
+            cache_path.unlink(missing_ok=True)
+            etag_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _iter_json_items(stream: BinaryIO) -> Iterator[Dict[str, str]]:
+        """
+        Yields the entries of the JSON array read from stream. With ijson installed the array is stream-parsed, so
+        only one entry is materialized at a time instead of the whole ~10MB coins list.
+        """
+        if ijson is not None:
+            return ijson.items(stream, "item")
+        return iter(_json_loads(stream.read()))
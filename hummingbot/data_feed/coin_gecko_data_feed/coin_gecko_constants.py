@@ -58,6 +58,12 @@ class CoinGeckoAPITier(Enum):
 PING_REST_ENDPOINT = "/ping"
 PRICES_REST_ENDPOINT = "/coins/markets"
 SUPPORTED_VS_TOKENS_REST_ENDPOINT = "/simple/supported_vs_currencies"
+COINS_LIST_REST_ENDPOINT = "/coins/list"
+COIN_TICKERS_REST_ENDPOINT = "/coins/{}/tickers"
+SIMPLE_PRICE_REST_ENDPOINT = "/simple/price"
+
+# Market identifier that selects the aggregated /simple/price USD quote instead of a specific market ticker
+AGGREGATED_MARKET = "aggregated"
 
 COOLOFF_AFTER_BAN = 60.0 * 1.05
 
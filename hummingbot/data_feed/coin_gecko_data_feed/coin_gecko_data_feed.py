@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_constants import (
     PING_REST_ENDPOINT,
@@ -58,6 +59,20 @@ class CoinGeckoDataFeed(DataFeedBase):
     def price_dict(self) -> Dict[str, float]:
         return self._price_dict.copy()
 
+    @property
+    def api_tier(self) -> CoinGeckoAPITier:
+        return self._api_tier
+
+    @property
+    def auth_headers(self) -> Dict[str, str]:
+        """Authentication header of the API tier, empty when no API key is configured"""
+        headers = {}
+        if self._api_key:
+            header_key = self._api_tier.value.header
+            if header_key:
+                headers[header_key] = self._api_key
+        return headers
+
     @property
     def health_check_endpoint(self) -> str:
         base_url = self._api_tier.value.base_url
@@ -110,16 +125,14 @@ class CoinGeckoDataFeed(DataFeedBase):
 
         return await self._execute_request(url=price_url, params=params)
 
+    async def get_rest_assistant(self) -> RESTAssistant:
+        """REST assistant throttled by the tier rate limits, shared with other CoinGecko clients of the same budget"""
+        return await self._api_factory.get_rest_assistant()
+
     async def _execute_request(self, url: str, params: Optional[Dict] = None) -> Any:
         """Helper method to execute requests with proper authentication based on tier"""
-        rest_assistant = await self._api_factory.get_rest_assistant()
-        headers = {}
-
-        # Add authentication header if API key is provided
-        if self._api_key:
-            header_key = self._api_tier.value.header
-            if header_key:
-                headers[header_key] = self._api_key
+        rest_assistant = await self.get_rest_assistant()
+        headers = self.auth_headers
 
         return await rest_assistant.execute_request(
             url=url,
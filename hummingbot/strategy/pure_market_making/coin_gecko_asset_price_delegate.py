@@ -1,11 +1,15 @@
+import asyncio
+import logging
 from decimal import Decimal
 from typing import Optional
-import time
-import logging
-import requests
 
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_client import CoinGeckoClient
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+_LOGGER = logging.getLogger(__name__)
+
+
 class CoinGeckoAssetPriceDelegate(AssetPriceDelegate):
     def __init__(self, base_token: str, quote_market_identifier: str, refresh_interval: float = 30.0):
         super().__init__()
@@ -14,17 +18,17 @@ class CoinGeckoAssetPriceDelegate(AssetPriceDelegate):
         self._refresh_interval = refresh_interval
         self._base_token_coingecko_id: Optional[str] = None
         self._last_cg_price: Optional[Decimal] = None
-        self._last_cg_price_time: float = 0
-        self._logger = logging.getLogger(__name__)
-        self._logger.info(f"[CoinGeckoAssetPriceDelegate] Initialized with base_token={base_token}, quote_market_identifier={quote_market_identifier}, refresh_interval={refresh_interval}")
+        self._last_logged_ready: bool = False
+        _LOGGER.info(f"[CoinGeckoAssetPriceDelegate] Initialized with base_token={base_token}, quote_market_identifier={quote_market_identifier}, refresh_interval={refresh_interval}")
+        self._refresh_task: Optional[asyncio.Task] = safe_ensure_future(self._refresh_loop())
 
     @property
     def ready(self) -> bool:
-        if self._last_cg_price is None:
-            # Try to fetch price immediately if not already fetched
-            self.c_get_mid_price()
         ready = self._last_cg_price is not None
-        self._logger.info(f"[CoinGeckoAssetPriceDelegate] .ready called, value: {ready}, last_cg_price: {self._last_cg_price}")
+        if ready != self._last_logged_ready:
+            # ready is polled every tick, only log when it changes
+            self._last_logged_ready = ready
+            _LOGGER.info(f"[CoinGeckoAssetPriceDelegate] ready changed to {ready}, last_cg_price: {self._last_cg_price}")
         return ready
 
     @property
@@ -33,74 +37,49 @@ class CoinGeckoAssetPriceDelegate(AssetPriceDelegate):
         return None
 
     def get_price_by_type(self, price_type) -> Decimal:
-        price = self.c_get_mid_price()
-        self._logger.info(f"[CoinGeckoAssetPriceDelegate] get_price_by_type({price_type}) -> {price}")
-        return price
+        return self.c_get_mid_price()
 
     def c_get_mid_price(self):
-        now = time.time()
-        self._logger.info(f"[CoinGeckoAssetPriceDelegate] c_get_mid_price called at {now}")
-        if self._base_token_coingecko_id is None:
-            self._logger.info(f"[CoinGeckoAssetPriceDelegate] Fetching CoinGecko ID for {self._base_token}")
-            self._base_token_coingecko_id = self.get_coingecko_id(self._base_token)
-            self._logger.info(f"[CoinGeckoAssetPriceDelegate] CoinGecko ID result: {self._base_token_coingecko_id}")
-        if self._base_token_coingecko_id is not None:
-            if self._last_cg_price is None or now - self._last_cg_price_time > self._refresh_interval:
-                self._logger.info(f"[CoinGeckoAssetPriceDelegate] Fetching price for {self._base_token_coingecko_id} on {self._quote_market_identifier}")
-                cg_price = self.get_price_from_specific_market_coingecko(self._base_token_coingecko_id, self._quote_market_identifier)
-                self._logger.info(f"[CoinGeckoAssetPriceDelegate] Price fetch result: {cg_price}")
-                if cg_price is not None:
-                    self._last_cg_price = cg_price
-                    self._last_cg_price_time = now
-                    self._logger.info(f"[CoinGeckoAssetPriceDelegate] Updated last_cg_price: {cg_price}")
-                else:
-                    self._logger.error(f"CoinGecko price unavailable for {self._base_token} on {self._quote_market_identifier}.")
-        else:
-            self._logger.error(f"CoinGecko ID unavailable for {self._base_token}.")
-        self._logger.info(f"[CoinGeckoAssetPriceDelegate] Returning price: {self._last_cg_price}")
+        # The price is kept fresh by the refresh task, no fetching or staleness check on the tick path
         return self._last_cg_price if self._last_cg_price is not None else Decimal('NaN')
 
+    def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self._refresh_price()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _LOGGER.error("Unexpected error refreshing CoinGecko price.", exc_info=True)
+            await asyncio.sleep(self._refresh_interval)
+
+    async def _refresh_price(self):
+        client = CoinGeckoClient.get_instance()
+        if self._base_token_coingecko_id is None:
+            self._base_token_coingecko_id = await client.get_coin_id_async(self._base_token)
+        if self._base_token_coingecko_id is None:
+            _LOGGER.error(f"CoinGecko ID unavailable for {self._base_token}.")
+            return
+        # Goes through the shared client cache, so controllers pricing the same market don't refetch it
+        cg_price = await client.get_price(self._base_token_coingecko_id,
+                                          self._quote_market_identifier,
+                                          self._refresh_interval)
+        if cg_price is None:
+            _LOGGER.error(f"CoinGecko price unavailable for {self._base_token} on {self._quote_market_identifier}.")
+        elif cg_price != self._last_cg_price:
+            _LOGGER.info(f"[CoinGeckoAssetPriceDelegate] Updated last_cg_price: {cg_price}")
+            self._last_cg_price = cg_price
+
     @staticmethod
     def get_coingecko_id(symbol: str) -> Optional[str]:
-        url = "https://api.coingecko.com/api/v3/coins/list"
-        try:
-            logging.getLogger(__name__).info(f"[CoinGeckoAssetPriceDelegate] Requesting CoinGecko ID for symbol: {symbol}")
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            for coin in data:
-                if coin["symbol"].lower() == symbol.lower():
-                    logging.getLogger(__name__).info(f"[CoinGeckoAssetPriceDelegate] Found CoinGecko ID: {coin['id']} for symbol: {symbol}")
-                    return coin["id"]
-        except Exception as e:
-            logging.getLogger(__name__).error(f"Error fetching CoinGecko ID for {symbol}: {e}")
-        return None
+        return CoinGeckoClient.get_instance().get_coin_id(symbol)
 
     @staticmethod
-    def get_price_from_specific_market_coingecko(base_token_id: str, quote_market_identifier: str) -> Optional[Decimal]:
-        url_tickers = f"https://api.coingecko.com/api/v3/coins/{base_token_id}/tickers"
-        try:
-            logging.getLogger(__name__).info(f"[CoinGeckoAssetPriceDelegate] Requesting price for {base_token_id} on {quote_market_identifier}")
-            response_tickers = requests.get(url_tickers)
-            response_tickers.raise_for_status()
-            data_tickers = response_tickers.json()
-        except requests.exceptions.RequestException as e:
-            logging.getLogger(__name__).error(f"Error fetching ticker data from CoinGecko: {e}")
-            return None
-
-        if "tickers" in data_tickers and data_tickers["tickers"]:
-            for ticker in data_tickers["tickers"]:
-                market_identifier = ticker.get("market", {}).get("identifier")
-                if market_identifier == quote_market_identifier:
-                    price_usd = ticker.get("converted_last", {}).get("usd")
-                    if price_usd is not None:
-                        logging.getLogger(__name__).info(f"[CoinGeckoAssetPriceDelegate] Found price: {price_usd} for {base_token_id} on {quote_market_identifier}")
-                        return Decimal(str(price_usd))
-                    else:
-                        logging.getLogger(__name__).warning(f"Price data not available for {base_token_id} on market {quote_market_identifier}.")
-                        return None
-            logging.getLogger(__name__).warning(f"Market with identifier '{quote_market_identifier}' not found for {base_token_id} on CoinGecko.")
-            return None
-        else:
-            logging.getLogger(__name__).warning(f"No ticker data found for {base_token_id} on CoinGecko.")
-            return None 
\ No newline at end of file
+    async def get_price_from_specific_market_coingecko(base_token_id: str,
+                                                       quote_market_identifier: str) -> Optional[Decimal]:
+        return await CoinGeckoClient.get_instance().fetch_price(base_token_id, quote_market_identifier)
@@ -457,7 +457,8 @@ pure_market_making_config_map = {
                   validator=validate_lower_bound),
     "cg_market":
         ConfigVar(key="cg_market",
-                  prompt="Enter the CoinGecko market identifier (e.g. osmosis, kucoin, etc.) >>> ",
+                  prompt="Enter the CoinGecko market identifier (e.g. osmosis, kucoin, etc.), "
+                         "or aggregated for the aggregated USD price >>> ",
                   required_if=lambda: pure_market_making_config_map.get("price_source").value == "coingecko",
                   type_str="str",
                   default="osmosis"),
@@ -1,9 +1,9 @@
+import asyncio
 import logging
 import os
 from decimal import Decimal
 from typing import Dict, List, Optional
 
-import requests
 from pydantic import Field
 
 from hummingbot.client.config.config_data_types import BaseClientModel
@@ -11,48 +11,15 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_client import CoinGeckoClient
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
 # Function to get CoinGecko ID for a symbol
 def get_coingecko_id(symbol: str) -> str | None:
-    url = "https://api.coingecko.com/api/v3/coins/list"
-    response = requests.get(url)
-    response.raise_for_status() # Raise an exception for bad status codes
-    data = response.json()
-    
-    for coin in data:
-        if coin["symbol"].lower() == symbol.lower():
-            return coin["id"]
-    return None
-
-# Function to get price from a specific market on CoinGecko
-def get_price_from_specific_market_coingecko(base_token_id: str, quote_market_identifier: str) -> Optional[Decimal]:
-    url_tickers = f"https://api.coingecko.com/api/v3/coins/{base_token_id}/tickers"
-    try:
-        response_tickers = requests.get(url_tickers)
-        response_tickers.raise_for_status() # Raise an exception for bad status codes
-        data_tickers = response_tickers.json()
-    except requests.exceptions.RequestException as e:
-        logging.getLogger().error(f"Error fetching ticker data from CoinGecko: {e}")
-        return None
-
-    if "tickers" in data_tickers and data_tickers["tickers"]:
-        for ticker in data_tickers["tickers"]:
-            market_identifier = ticker.get("market", {}).get("identifier")
-            if market_identifier == quote_market_identifier:
-                price_usd = ticker.get("converted_last", {}).get("usd")
-                if price_usd is not None:
-                    return Decimal(str(price_usd))
-                else:
-                    logging.getLogger().warning(f"Price data not available for {base_token_id} on market {quote_market_identifier}.")
-                    return None
-        # If loop finishes without finding the market
-        logging.getLogger().warning(f"Market with identifier '{quote_market_identifier}' not found for {base_token_id} on CoinGecko.")
-        return None
-    else:
-        logging.getLogger().warning(f"No ticker data found for {base_token_id} on CoinGecko.")
-        return None
+    # Resolved from the shared client's symbol index, backed by the coins list cached on disk for a day
+    return CoinGeckoClient.get_instance().get_coin_id(symbol)
 
 
 class SimplePMMCMCConfig(BaseClientModel):
@@ -89,12 +56,24 @@ class SimplePMMCMC(ScriptStrategyBase):
     def __init__(self, connectors: Dict[str, ConnectorBase], config: SimplePMMCMCConfig):
         super().__init__(connectors)
         self.config = config
+        self._last_ref_price: Optional[Decimal] = None
+        # Spread multipliers are fixed by the config, computed once instead of on every proposal
+        self._bid_multiplier = Decimal(1) - self.config.bid_spread
+        self._ask_multiplier = Decimal(1) + self.config.ask_spread
+        self._pending_price_task: Optional[asyncio.Task] = None
 
     def on_tick(self):
         # Check if CoinGecko ID was found during initialization
         if self._base_token_coingecko_id is None:
              return # Do not proceed if CoinGecko ID is missing
 
+        # The price is fetched in the background so the tick never waits on CoinGecko, if the previous fetch is
+        # still in flight the last price is used
+        if self._pending_price_task is None or self._pending_price_task.done():
+            self._pending_price_task = safe_ensure_future(self._fetch_price_async())
+        if self._last_ref_price is None:
+            return # Wait for the first CoinGecko price
+
         if self.create_timestamp <= self.current_timestamp:
             self.cancel_all_orders()
             proposal: List[OrderCandidate] = self.create_proposal()
@@ -102,22 +81,33 @@ class SimplePMMCMC(ScriptStrategyBase):
             self.place_orders(proposal_adjusted)
             self.create_timestamp = self.config.order_refresh_time + self.current_timestamp
 
-    def create_proposal(self) -> List[OrderCandidate]:
-        # Get price from specific CoinGecko market
-        ref_price = get_price_from_specific_market_coingecko(self._base_token_coingecko_id, self.config.quote_market)
-        
+    async def on_stop(self):
+        if self._pending_price_task is not None:
+            self._pending_price_task.cancel()
+            self._pending_price_task = None
+
+    async def _fetch_price_async(self):
+        # Served from the shared client cache until it is older than the order refresh time
+        ref_price = await CoinGeckoClient.get_instance().get_price(self._base_token_coingecko_id,
+                                                                   self.config.quote_market,
+                                                                   self.config.order_refresh_time)
         if ref_price is None:
             self.logger().error(f"Could not get price for {self.config.base_token} from market {self.config.quote_market} on CoinGecko.")
-            return []
+            return
+        self._last_ref_price = ref_price
+
+    def create_proposal(self) -> List[OrderCandidate]:
+        # Last price from the specific CoinGecko market
+        ref_price = self._last_ref_price
 
-        buy_price = ref_price * Decimal(1 - self.config.bid_spread)
-        sell_price = ref_price * Decimal(1 + self.config.ask_spread)
+        buy_price = ref_price * self._bid_multiplier
+        sell_price = ref_price * self._ask_multiplier
 
         buy_order = OrderCandidate(trading_pair=self.config.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
-                                   order_side=TradeType.BUY, amount=Decimal(self.config.order_amount), price=buy_price)
+                                   order_side=TradeType.BUY, amount=self.config.order_amount, price=buy_price)
 
         sell_order = OrderCandidate(trading_pair=self.config.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
-                                    order_side=TradeType.SELL, amount=Decimal(self.config.order_amount), price=sell_price)
+                                    order_side=TradeType.SELL, amount=self.config.order_amount, price=sell_price)
 
         return [buy_order, sell_order]
 
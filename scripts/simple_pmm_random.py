@@ -47,6 +47,9 @@ class SimplePMMRandom(ScriptStrategyBase):
     def __init__(self, connectors: Dict[str, ConnectorBase], config: SimplePMMRandomConfig):
         super().__init__(connectors)
         self.config = config
+        # Spread multipliers are fixed by the config, computed once instead of on every proposal
+        self._bid_multiplier = Decimal(1) - self.config.bid_spread
+        self._ask_multiplier = Decimal(1) + self.config.ask_spread
 
     def on_tick(self):
         if self.create_timestamp <= self.current_timestamp:
@@ -98,12 +101,14 @@ class SimplePMMRandom(ScriptStrategyBase):
         return True
 
     def create_proposal(self) -> List[OrderCandidate]:
-        ref_price = self.connectors[self.config.exchange].get_price_by_type(self.config.trading_pair, self.price_source)
-        buy_price = ref_price * Decimal(1 - self.config.bid_spread)
-        sell_price = ref_price * Decimal(1 + self.config.ask_spread)
+        connector = self.connectors[self.config.exchange]
+        ref_price = connector.get_price_by_type(self.config.trading_pair, self.price_source)
+        buy_price = ref_price * self._bid_multiplier
+        sell_price = ref_price * self._ask_multiplier
 
-        # Generate random order amount between min and max
-        random_amount = Decimal(str(random.uniform(
+        # Generate random order amount between min and max, rounded to the pair's order size increment directly
+        # instead of through a str round trip
+        random_amount = connector.quantize_order_amount(self.config.trading_pair, Decimal(random.uniform(
             float(self.config.min_order_amount),
             float(self.config.max_order_amount)
         )))
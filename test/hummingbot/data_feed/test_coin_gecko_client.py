@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import re
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable
+from unittest.mock import MagicMock
+
+from aioresponses import aioresponses
+
+from hummingbot.data_feed.coin_gecko_data_feed import CoinGeckoDataFeed, coin_gecko_constants as CONSTANTS
+from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_client import CoinGeckoClient
+from hummingbot.data_feed.coin_gecko_data_feed.coin_gecko_constants import CoinGeckoAPITier
+
+
+class CoinGeckoClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "coingecko_list.json"
+        self.client = CoinGeckoClient(coins_list_cache_path=self.cache_path)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_get_coin_id_reads_coins_list_from_disk_cache(self):
+        coins = [
+            {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
+            {"id": "wrapped-bitcoin-fake", "symbol": "btc", "name": "Fake Bitcoin"},
+            {"id": "ethereum", "symbol": "eth", "name": "Ethereum"},
+        ]
+        self.cache_path.write_text(json.dumps(coins))
+
+        self.assertEqual("bitcoin", self.client.get_coin_id("BTC"))
+        self.assertEqual("ethereum", self.client.get_coin_id("eth"))
+        self.assertIsNone(self.client.get_coin_id("xyz"))
+
+    def test_get_coin_id_revalidates_expired_cache_with_etag(self):
+        self.cache_path.write_text(json.dumps([{"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"}]))
+        self.cache_path.with_suffix(".etag").write_text('W/"123"')
+        os.utime(self.cache_path, (0, 0))
+        response = MagicMock(status_code=304)
+        response.__enter__.return_value = response
+        self.client._session.get = MagicMock(return_value=response)
+
+        self.assertEqual("bitcoin", self.client.get_coin_id("btc"))
+        self.assertEqual('W/"123"', self.client._session.get.call_args.kwargs["headers"]["If-None-Match"])
+        self.assertGreater(self.cache_path.stat().st_mtime, 0)
+
+    @aioresponses()
+    def test_get_price_from_specific_market(self, mock_api):
+        regex_url = re.compile(f"^{self.client.base_url}{CONSTANTS.COIN_TICKERS_REST_ENDPOINT.format('bitcoin')}")
+        resp = {
+            "tickers": [
+                {"market": {"identifier": "binance"}, "converted_last": {"usd": 60000.5}},
+                {"market": {"identifier": "mxc"}, "converted_last": {"usd": 60001.5}},
+            ]
+        }
+        mock_api.get(regex_url, body=json.dumps(resp))
+
+        price = self.async_run_with_timeout(self.client.get_price("bitcoin", "mxc", max_age=30))
+
+        self.assertEqual(Decimal("60001.5"), price)
+        self.assertEqual(Decimal("60001.5"), self.client.get_cached_price("bitcoin", "mxc"))
+
+    @aioresponses()
+    def test_get_price_sends_api_key_header_of_the_tier(self, mock_api):
+        self.client = CoinGeckoClient(data_feed=CoinGeckoDataFeed(api_key="someKey", api_tier=CoinGeckoAPITier.DEMO),
+                                      coins_list_cache_path=self.cache_path)
+        regex_url = re.compile(f"^{CoinGeckoAPITier.DEMO.value.base_url}{CONSTANTS.SIMPLE_PRICE_REST_ENDPOINT}")
+        mock_api.get(regex_url, body=json.dumps({"bitcoin": {"usd": 60000}}))
+
+        price = self.async_run_with_timeout(
+            self.client.get_price("bitcoin", CONSTANTS.AGGREGATED_MARKET, max_age=30))
+
+        self.assertEqual(Decimal("60000"), price)
+        request = next(iter(mock_api.requests.values()))[0]
+        self.assertEqual("someKey", request.kwargs["headers"][CoinGeckoAPITier.DEMO.value.header])
+
+    @aioresponses()
+    def test_get_price_reuses_fresh_cached_price(self, mock_api):
+        regex_url = re.compile(f"^{self.client.base_url}{CONSTANTS.SIMPLE_PRICE_REST_ENDPOINT}")
+        mock_api.get(regex_url, body=json.dumps({"bitcoin": {"usd": 60000}}))
+
+        first = self.async_run_with_timeout(
+            self.client.get_price("bitcoin", CONSTANTS.AGGREGATED_MARKET, max_age=30))
+        second = self.async_run_with_timeout(
+            self.client.get_price("bitcoin", CONSTANTS.AGGREGATED_MARKET, max_age=30))
+
+        self.assertEqual(Decimal("60000"), first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, sum(len(calls) for calls in mock_api.requests.values()))
+
+    @aioresponses()
+    def test_get_price_returns_none_when_market_not_listed(self, mock_api):
+        regex_url = re.compile(f"^{self.client.base_url}{CONSTANTS.COIN_TICKERS_REST_ENDPOINT.format('bitcoin')}")
+        resp = {"tickers": [{"market": {"identifier": "binance"}, "converted_last": {"usd": 60000.5}}]}
+        mock_api.get(regex_url, body=json.dumps(resp))
+
+        price = self.async_run_with_timeout(self.client.get_price("bitcoin", "mxc", max_age=30))
+
+        self.assertIsNone(price)
+        self.assertIsNone(self.client.get_cached_price("bitcoin", "mxc"))
+
+    @aioresponses()
+    def test_get_price_returns_last_known_price_when_rate_limited(self, mock_api):
+        regex_url = re.compile(f"^{self.client.base_url}{CONSTANTS.SIMPLE_PRICE_REST_ENDPOINT}")
+        mock_api.get(regex_url, body=json.dumps({"bitcoin": {"usd": 60000}}), repeat=True)
+        self.async_run_with_timeout(self.client.get_price("bitcoin", CONSTANTS.AGGREGATED_MARKET, max_age=30))
+        for _ in range(CONSTANTS.PUBLIC.rate_limit):
+            self.client._try_acquire_request_slot()
+
+        price = self.async_run_with_timeout(
+            self.client.get_price("bitcoin", CONSTANTS.AGGREGATED_MARKET, max_age=0))
+
+        self.assertEqual(Decimal("60000"), price)
+        self.assertEqual(1, sum(len(calls) for calls in mock_api.requests.values()))
+
+    @aioresponses()
+    def test_concurrent_get_price_calls_share_one_request(self, mock_api):
+        regex_url = re.compile(f"^{self.client.base_url}{CONSTANTS.SIMPLE_PRICE_REST_ENDPOINT}")
+        mock_api.get(regex_url, body=json.dumps({"bitcoin": {"usd": 60000}}), repeat=True)
+
+        prices = self.async_run_with_timeout(asyncio.gather(
+            *(self.client.get_price("bitcoin", CONSTANTS.AGGREGATED_MARKET, max_age=30) for _ in range(3))))
+
+        self.assertEqual([Decimal("60000")] * 3, prices)
+        self.assertEqual(1, sum(len(calls) for calls in mock_api.requests.values()))